@@ -2,11 +2,14 @@
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
 """Data for tests and documentation with DREAM."""
 
+from functools import cache
+
 _version = "1"
 
 __all__ = ["get_path"]
 
 
+@cache
 def _make_pooch():
     import pooch
 
@@ -31,9 +34,6 @@ def _make_pooch():
     )
 
 
-_pooch = _make_pooch()
-
-
 def get_path(name: str, unzip: bool = False) -> str:
     """
     Return the path to a data file bundled with ess.dream.
@@ -43,7 +43,7 @@ def get_path(name: str, unzip: bool = False) -> str:
     """
     import pooch
 
-    return _pooch.fetch(name, processor=pooch.Unzip() if unzip else None)
+    return _make_pooch().fetch(name, processor=pooch.Unzip() if unzip else None)
 
 
 def simulated_diamond_sample() -> str:
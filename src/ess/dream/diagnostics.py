@@ -214,17 +214,26 @@ def _product(it):
 def unwrap_flat_indices_2d(
     x_sizes: dict[str, int], y_sizes: dict[str, int]
 ) -> Callable[[int, int], dict[str, int]]:
+    # Reverse once here instead of on every call, unwrap is called per mouse move.
+    reversed_x_sizes = tuple(reversed(x_sizes.items()))
+    reversed_y_sizes = tuple(reversed(y_sizes.items()))
+
     def unwrap(x: int, y: int) -> dict[str, int]:
-        return {**_unwrap_flat_index(x, x_sizes), **_unwrap_flat_index(y, y_sizes)}
+        return {
+            **_unwrap_flat_index(x, reversed_x_sizes),
+            **_unwrap_flat_index(y, reversed_y_sizes),
+        }
 
     return unwrap
 
 
-def _unwrap_flat_index(index: int, sizes: dict[str, int]) -> dict[str, int]:
+def _unwrap_flat_index(
+    index: int, reversed_sizes: tuple[tuple[str, int], ...]
+) -> dict[str, int]:
     res = []
-    for key, size in reversed(sizes.items()):
-        res.append((key, index % size))
-        index //= size
+    for key, size in reversed_sizes:
+        index, res_index = divmod(index, size)
+        res.append((key, res_index))
     return dict(reversed(res))  # Reverse to reproduce the input order.
 
 
@@ -297,12 +297,19 @@ def apply_lorentz_correction(da: sc.DataArray) -> sc.DataArray:
     two_theta = event_or_outer_coord(da, "two_theta")
     theta = 0.5 * two_theta
 
-    d4 = dspacing.broadcast(sizes=out.sizes) ** 4
+    # Compute the power before broadcasting so that it is only evaluated
+    # on the (possibly smaller) coord and the full-size buffer is allocated once.
+    d4 = dspacing**4
+    dtype = out.dtype if out.bins is None else out.bins.dtype
+    if d4.dims != out.dims:
+        d4 = d4.broadcast(sizes=out.sizes).to(dtype=dtype, copy=True)
+    else:
+        d4 = d4.to(dtype=dtype, copy=False)
     if out.bins is None:
-        out.data = d4.to(dtype=out.dtype, copy=False)
+        out.data = d4
         out_data = out.data
     else:
-        out.bins.data = d4.to(dtype=out.bins.dtype, copy=False)
+        out.bins.data = d4
         out_data = out.bins.data
     out_data *= sc.sin(theta, out=theta)
     out_data *= da.data if da.bins is None else da.bins.data
@@ -4,6 +4,7 @@
 Beamline parameters and utilities for POWGEN.
 """
 
+import numpy as np
 import scipp as sc
 
 from ...powder.types import (
@@ -32,11 +33,8 @@ def map_detector_to_spectrum(
     :
         `data` with 'detector' coord and dim replaced by 'spectrum'.
     """
-    if not sc.identical(
-        data.coords["detector"].to(
-            dtype=detector_info.coords["detector"].dtype, copy=False
-        ),
-        detector_info.coords["detector"],
+    if not _detector_coords_match(
+        data.coords["detector"], detector_info.coords["detector"]
     ):
         raise sc.CoordError(
             "The 'detector' coords of `data` and `detector_info` do not match."
@@ -46,13 +44,23 @@ def map_detector_to_spectrum(
     del out.coords["detector"]
     # Add 1 because spectrum numbers in the data start at 1 but
     # detector_info contains spectrum indices which start at 0.
-    out.coords["spectrum"] = detector_info.coords["spectrum"] + sc.index(
-        1, dtype=detector_info.coords["spectrum"].dtype
-    )
+    spectrum = detector_info.coords["spectrum"].copy()
+    spectrum.values += 1
+    out.coords["spectrum"] = spectrum
 
     return out.rename_dims({"detector": "spectrum"})
 
 
+def _detector_coords_match(a: sc.Variable, b: sc.Variable) -> bool:
+    # Compare the values directly to avoid converting `a` to the dtype of `b`.
+    return (
+        a.dims == b.dims
+        and a.shape == b.shape
+        and a.unit == b.unit
+        and bool(np.array_equal(a.values, b.values))
+    )
+
+
 def powgen_detector_dimensions(
     detector_name: NeXusDetectorName,
 ) -> DetectorBankSizes:
@@ -19,7 +19,8 @@ from ...powder.logging import get_logger
 
 def _as_boolean_mask(var: sc.Variable) -> sc.Variable:
     if var.dtype in ('float32', 'float64'):
-        if sc.any(var != var.to(dtype='int64')).value:
+        values = var.values
+        if np.any(~np.isfinite(values) | (values != np.trunc(values))):
             raise ValueError(
                 'Cannot construct boolean mask, the input mask has fractional values.'
             )
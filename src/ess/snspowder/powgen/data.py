@@ -3,6 +3,8 @@
 
 """Utilities for loading example data for POWGEN."""
 
+from functools import cache
+
 import scipp as sc
 
 from ess.powder.types import (
@@ -20,6 +22,7 @@ from ess.powder.types import (
 _version = "1"
 
 
+@cache
 def _make_pooch():
     import pooch
 
@@ -43,9 +46,6 @@ def _make_pooch():
     )
 
 
-_pooch = _make_pooch()
-
-
 def _get_path(name: str) -> str:
     """
     Return the path to a data file bundled with scippneutron.
@@ -56,9 +56,9 @@ def _get_path(name: str) -> str:
     import pooch
 
     if name.endswith(".zip"):
-        (path,) = _pooch.fetch(name, processor=pooch.Unzip())
+        (path,) = _make_pooch().fetch(name, processor=pooch.Unzip())
     else:
-        path = _pooch.fetch(name)
+        path = _make_pooch().fetch(name)
     return path
 
 
@@ -124,9 +124,12 @@ def extract_raw_data(
     """Return the events from a loaded data group."""
     # Remove the tof binning and dimension, as it is not needed and it gets in the way
     # of masking.
-    out = dg["data"].squeeze()
-    out.coords.pop("tof", None)
-    out = out.fold(dim="spectrum", sizes=sizes)
+    data = dg["data"]
+    if "tof" in data.dims:
+        data = data.squeeze("tof")
+    out = data.fold(dim="spectrum", sizes=sizes)
+    if "tof" in out.coords:
+        del out.coords["tof"]
     return DetectorData[RunType](out)
 
 
@@ -136,10 +139,10 @@ def extract_proton_charge(dg: RawDataAndMetadata[RunType]) -> ProtonCharge[RunTy
 
 
 def extract_accumulated_proton_charge(
-    data: DetectorData[RunType],
+    dg: RawDataAndMetadata[RunType],
 ) -> AccumulatedProtonCharge[RunType]:
     """Return the stored accumulated proton charge from a loaded data group."""
-    return AccumulatedProtonCharge[RunType](data.coords["gd_prtn_chrg"])
+    return AccumulatedProtonCharge[RunType](dg["data"].coords["gd_prtn_chrg"])
 
 
 providers = (
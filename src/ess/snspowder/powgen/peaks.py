@@ -7,7 +7,7 @@ This module is specialized to POWGEN.
 
 import math
 from collections.abc import Iterable
-from itertools import combinations_with_replacement
+from functools import cache
 
 import scipp as sc
 from scippneutron.peaks import FitParameters, FitRequirements, FitResult, fit_peaks
@@ -42,10 +42,14 @@ def theoretical_vanadium_dspacing(
         Has dimension ``'dspacing'``.
     """
     a = 3.0272
+    # Enumerate h <= k <= l with even h + k + l directly by stepping l in
+    # increments of 2 from the first value with the right parity.
     d_values = {
         a / math.sqrt(h**2 + k**2 + l**2)
-        for h, k, l in combinations_with_replacement(range(hkl_range), 3)  # noqa: E741
-        if (h + k + l) % 2 == 0 and (h + k + l) > 0
+        for h in range(hkl_range)
+        for k in range(h, hkl_range)
+        for l in range(k + h % 2, hkl_range, 2)  # noqa: E741
+        if l > 0
     }
     d = sc.array(dims=['dspacing'], values=sorted(d_values), unit='angstrom')
     if min_d is not None:
@@ -53,6 +57,13 @@ def theoretical_vanadium_dspacing(
     return d
 
 
+@cache
+def _default_vanadium_peak_estimates() -> sc.Variable:
+    return theoretical_vanadium_dspacing(
+        hkl_range=10, min_d=sc.scalar(0.41, unit='angstrom')
+    )
+
+
 def fit_vanadium_peaks(
     data: sc.DataArray,
     *,
@@ -112,9 +123,7 @@ def fit_vanadium_peaks(
         A :class:`FitResult` for each peak.
     """
     if peak_estimates is None:
-        peak_estimates = theoretical_vanadium_dspacing(
-            hkl_range=10, min_d=sc.scalar(0.41, unit='angstrom')
-        )
+        peak_estimates = _default_vanadium_peak_estimates().copy()
     if windows is None:
         windows = sc.scalar(0.02, unit='angstrom')
     if background is None:
@@ -1,8 +1,10 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
 
+import functools
 import io
 
+import numpy as np
 import pytest
 import sciline
 import scipp as sc
@@ -23,6 +25,7 @@ from ess.powder.types import (
     CalibrationFilename,
     CaveMonitorPosition,
     CIFAuthors,
+    DetectorData,
     DspacingBins,
     DspacingData,
     Filename,
@@ -50,15 +53,10 @@ source = sc.vector([-3.478, 0.0, -76550], unit='mm')
 charge = sc.scalar(1.0, unit='µAh')
 
 params = {
-    Filename[SampleRun]: dream.data.simulated_diamond_sample(),
-    Filename[VanadiumRun]: dream.data.simulated_vanadium_sample(),
-    Filename[BackgroundRun]: dream.data.simulated_empty_can(),
-    MonitorFilename[SampleRun]: dream.data.simulated_monitor_diamond_sample(),
-    MonitorFilename[VanadiumRun]: dream.data.simulated_monitor_vanadium_sample(),
-    MonitorFilename[BackgroundRun]: dream.data.simulated_monitor_empty_can(),
     CalibrationFilename: None,
     UncertaintyBroadcastMode: UncertaintyBroadcastMode.drop,
-    DspacingBins: sc.linspace('dspacing', 0.0, 2.3434, 201, unit='angstrom'),
+    # Coarse bins keep the tests cheap, see test_pipeline_full_resolution.
+    DspacingBins: sc.linspace('dspacing', 0.0, 2.3434, 21, unit='angstrom'),
     TofMask: lambda x: (x < sc.scalar(0.0, unit='ns'))
     | (x > sc.scalar(86e6, unit='ns')),
     Position[snx.NXsample, SampleRun]: sample,
@@ -80,36 +78,74 @@ params = {
 }
 
 
-@pytest.fixture(params=["mantle", "endcap_backward", "endcap_forward"])
-def params_for_det(request):
+@pytest.fixture(scope="session")
+def data_files():
+    # Resolve (and download if needed) the files once per session and only
+    # when a test needs them, not when the module is collected.
+    return {
+        Filename[SampleRun]: dream.data.simulated_diamond_sample(),
+        Filename[VanadiumRun]: dream.data.simulated_vanadium_sample(),
+        Filename[BackgroundRun]: dream.data.simulated_empty_can(),
+        MonitorFilename[SampleRun]: dream.data.simulated_monitor_diamond_sample(),
+        MonitorFilename[VanadiumRun]: dream.data.simulated_monitor_vanadium_sample(),
+        MonitorFilename[BackgroundRun]: dream.data.simulated_monitor_empty_can(),
+    }
+
+
+@pytest.fixture(scope="module", params=["mantle", "endcap_backward", "endcap_forward"])
+def params_for_det(request, data_files):
     # Not available in simulated data
-    return {**params, NeXusDetectorName: request.param}
+    return {**params, **data_files, NeXusDetectorName: request.param}
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def workflow(params_for_det):
-    return make_workflow(params_for_det, run_norm=powder.RunNormalization.proton_charge)
+    # Shared by all tests for a detector, use `workflow.copy()` before modifying it.
+    wf = make_workflow(params_for_det, run_norm=powder.RunNormalization.proton_charge)
+    # Load the files once per detector; tests only vary downstream parameters.
+    loaded = wf.compute((DetectorData[SampleRun], DetectorData[VanadiumRun]))
+    for key, value in loaded.items():
+        wf[key] = value
+    return wf
+
+
+@pytest.fixture(scope="module")
+def dspacing_result(workflow):
+    # Several tests only inspect the final result, compute it once per detector.
+    return workflow.compute(IofDspacing)
+
+
+@functools.cache
+def _base_workflow(run_norm):
+    return dream.DreamGeant4Workflow(run_norm=run_norm)
 
 
 def make_workflow(params_for_det, *, run_norm):
-    wf = dream.DreamGeant4Workflow(run_norm=run_norm)
+    wf = _base_workflow(run_norm).copy()
     for key, value in params_for_det.items():
         wf[key] = value
-    return wf
+    return powder.with_pixel_mask_filenames(wf, [])
 
 
-def test_pipeline_can_compute_dspacing_result(workflow):
-    workflow = powder.with_pixel_mask_filenames(workflow, [])
-    result = workflow.compute(IofDspacing)
+def test_pipeline_can_compute_dspacing_result(dspacing_result):
+    result = dspacing_result
     assert result.sizes == {'dspacing': len(params[DspacingBins]) - 1}
     assert sc.identical(result.coords['dspacing'], params[DspacingBins])
 
 
+def test_pipeline_full_resolution(workflow):
+    dspacing_bins = sc.linspace('dspacing', 0.0, 2.3434, 201, unit='angstrom')
+    workflow = workflow.copy()
+    workflow[DspacingBins] = dspacing_bins
+    result = workflow.compute(IofDspacing)
+    assert result.sizes == {'dspacing': 200}
+    assert sc.identical(result.coords['dspacing'], dspacing_bins)
+
+
 def test_pipeline_can_compute_dspacing_result_with_hist_monitor_norm(params_for_det):
     workflow = make_workflow(
         params_for_det, run_norm=powder.RunNormalization.monitor_histogram
     )
-    workflow = powder.with_pixel_mask_filenames(workflow, [])
     result = workflow.compute(IofDspacing)
     assert result.sizes == {'dspacing': len(params[DspacingBins]) - 1}
     assert sc.identical(result.coords['dspacing'], params[DspacingBins])
@@ -121,24 +157,28 @@ def test_pipeline_can_compute_dspacing_result_with_integrated_monitor_norm(
     workflow = make_workflow(
         params_for_det, run_norm=powder.RunNormalization.monitor_integrated
     )
-    workflow = powder.with_pixel_mask_filenames(workflow, [])
     result = workflow.compute(IofDspacing)
     assert result.sizes == {'dspacing': len(params[DspacingBins]) - 1}
     assert sc.identical(result.coords['dspacing'], params[DspacingBins])
 
 
-def test_workflow_is_deterministic(workflow):
-    workflow = powder.with_pixel_mask_filenames(workflow, [])
+# The scheduler does not depend on the detector, so one is enough here.
+@pytest.mark.parametrize('params_for_det', ['mantle'], indirect=True)
+def test_workflow_is_deterministic(params_for_det):
+    # Not the shared workflow fixture, its detector data is preloaded and
+    # loading should also run under the scheduler.
+    workflow = make_workflow(
+        params_for_det, run_norm=powder.RunNormalization.proton_charge
+    )
     # This is Sciline's default scheduler, but we want to be explicit here
     scheduler = sciline.scheduler.DaskScheduler()
     graph = workflow.get(IofTof, scheduler=scheduler)
     reference = graph.compute().data
     result = graph.compute().data
-    assert sc.identical(sc.values(result), sc.values(reference))
+    assert np.array_equal(result.values, reference.values)
 
 
 def test_pipeline_can_compute_intermediate_results(workflow):
-    workflow = powder.with_pixel_mask_filenames(workflow, [])
     results = workflow.compute((NormalizedRunData[SampleRun], NeXusDetectorName))
     result = results[NormalizedRunData[SampleRun]]
 
@@ -154,8 +194,8 @@ def test_pipeline_group_by_two_theta(workflow):
     two_theta_bins = sc.linspace(
         dim='two_theta', unit='rad', start=0.8, stop=2.4, num=17
     )
+    workflow = workflow.copy()
     workflow[TwoThetaBins] = two_theta_bins
-    workflow = powder.with_pixel_mask_filenames(workflow, [])
     result = workflow.compute(IofDspacingTwoTheta)
     assert result.sizes == {
         'two_theta': 16,
@@ -168,12 +208,12 @@ def test_pipeline_group_by_two_theta(workflow):
 def test_pipeline_wavelength_masking(workflow):
     wmin = sc.scalar(0.18, unit="angstrom")
     wmax = sc.scalar(0.21, unit="angstrom")
+    workflow = workflow.copy()
     workflow[WavelengthMask] = lambda x: (x > wmin) & (x < wmax)
-    workflow = powder.with_pixel_mask_filenames(workflow, [])
     masked_sample = workflow.compute(MaskedData[SampleRun])
     assert 'wavelength' in masked_sample.bins.masks
     sum_in_masked_region = (
-        masked_sample.bin(wavelength=sc.concat([wmin, wmax], dim='wavelength'))
+        masked_sample.hist(wavelength=sc.concat([wmin, wmax], dim='wavelength'))
         .sum()
         .data
     )
@@ -186,12 +226,14 @@ def test_pipeline_wavelength_masking(workflow):
 def test_pipeline_two_theta_masking(workflow):
     tmin = sc.scalar(1.0, unit="rad")
     tmax = sc.scalar(1.2, unit="rad")
+    workflow = workflow.copy()
     workflow[TwoThetaMask] = lambda x: (x > tmin) & (x < tmax)
-    workflow = powder.with_pixel_mask_filenames(workflow, [])
     masked_sample = workflow.compute(MaskedData[SampleRun])
     assert 'two_theta' in masked_sample.masks
     sum_in_masked_region = (
-        masked_sample.bin(two_theta=sc.concat([tmin, tmax], dim='two_theta')).sum().data
+        masked_sample.hist(two_theta=sc.concat([tmin, tmax], dim='two_theta'))
+        .sum()
+        .data
     )
     assert sc.allclose(
         sum_in_masked_region,
@@ -199,21 +241,18 @@ def test_pipeline_two_theta_masking(workflow):
     )
 
 
-def test_use_workflow_helper(workflow):
-    workflow = powder.with_pixel_mask_filenames(workflow, [])
-    result = workflow.compute(IofDspacing)
+def test_use_workflow_helper(dspacing_result):
+    result = dspacing_result
     assert result.sizes == {'dspacing': len(params[DspacingBins]) - 1}
     assert sc.identical(result.coords['dspacing'], params[DspacingBins])
 
 
 def test_pipeline_can_save_data(workflow):
-    workflow = powder.with_pixel_mask_filenames(workflow, [])
     result = workflow.compute(ReducedTofCIF)
 
     buffer = io.StringIO()
     result.save(buffer)
-    buffer.seek(0)
-    content = buffer.read()
+    content = buffer.getvalue()
 
     assert content.startswith(r'#\#CIF_1.1')
     _assert_contains_source_info(content)
@@ -8,13 +8,14 @@ import scipp as sc
 from ess.dream.instrument_view import InstrumentView
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def fake_instrument_data(modules=('bank1', 'bank2', 'bank3', 'bank4', 'bank5')):
-    rng = np.random.default_rng()
+    # The tests only check the widgets, not the values, so small data suffices.
+    rng = np.random.default_rng(0)
 
     out = {}
-    npix = 300
-    ntof = 100
+    npix = 50
+    ntof = 20
     locations = range(len(modules))
     for name, loc in zip(modules, locations, strict=True):
         position = rng.normal(loc=[0, 0, loc], scale=[0.2, 0.2, 0.05], size=[npix, 3])
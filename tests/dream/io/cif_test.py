@@ -36,8 +36,7 @@ def cal() -> OutputCalibrationData:
 def save_reduced_tof_to_str(cif_: cif.CIF) -> str:
     buffer = io.StringIO()
     cif_.save(buffer)
-    buffer.seek(0)
-    return buffer.read()
+    return buffer.getvalue()
 
 
 def test_save_reduced_tof(ioftof: IofTof, cal: OutputCalibrationData) -> None:
@@ -21,9 +21,11 @@ bank_dims = {'wire', 'module', 'segment', 'strip', 'counter'}
 hr_sans_dims = {'strip', 'other'}
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def nexus_workflow() -> sciline.Pipeline:
-    return dream.io.nexus.LoadNeXusWorkflow()
+    wf = dream.io.nexus.LoadNeXusWorkflow()
+    wf[Filename[SampleRun]] = dream.data.get_path('DREAM_nexus_sorted-2023-12-07.nxs')
+    return wf
 
 
 @pytest.fixture(
@@ -36,14 +38,11 @@ def nexus_workflow() -> sciline.Pipeline:
     ]
 )
 def params(request):
-    params = {
-        Filename[SampleRun]: dream.data.get_path('DREAM_nexus_sorted-2023-12-07.nxs'),
-        NeXusDetectorName: request.param,
-    }
-    return params
+    return {NeXusDetectorName: request.param}
 
 
 def test_can_load_nexus_detector_data(nexus_workflow, params):
+    nexus_workflow = nexus_workflow.copy()
     for key, value in params.items():
         nexus_workflow[key] = value
     result = nexus_workflow.compute(CalibratedDetector[SampleRun])
@@ -61,15 +60,14 @@ def test_can_load_nexus_detector_data(nexus_workflow, params):
 
 
 def test_can_load_nexus_monitor_data(nexus_workflow):
-    nexus_workflow[Filename[SampleRun]] = dream.data.get_path(
-        'DREAM_nexus_sorted-2023-12-07.nxs'
-    )
+    nexus_workflow = nexus_workflow.copy()
     nexus_workflow[NeXusMonitorName[Monitor1]] = 'monitor_cave'
     result = nexus_workflow.compute(CalibratedMonitor[SampleRun, Monitor1])
     assert result.sizes == {'event_time_zero': 0}
 
 
 def test_assemble_nexus_detector_data(nexus_workflow, params):
+    nexus_workflow = nexus_workflow.copy()
     for key, value in params.items():
         nexus_workflow[key] = value
     result = nexus_workflow.compute(DetectorData[SampleRun])
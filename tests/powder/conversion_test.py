@@ -12,10 +12,10 @@ from ess.powder.conversion import (
 )
 
 
-@pytest.fixture(params=['random', 'zero'])
+@pytest.fixture(scope="module", params=['random', 'zero'])
 def calibration(request):
     rng = np.random.default_rng(789236)
-    n = 30
+    n = 4
     ds = sc.Dataset(
         data={
             'difa': sc.array(
@@ -40,21 +40,26 @@ def calibration(request):
     return ds
 
 
-def test_dspacing_with_calibration_roundtrip(calibration):
-    initial_tof = sc.DataArray(
-        sc.ones(dims=['spectrum', 'tof'], shape=[calibration.sizes['spectrum'], 27]),
+@pytest.fixture(scope="module")
+def base_tof(calibration):
+    return sc.DataArray(
+        sc.ones(dims=['spectrum', 'tof'], shape=[calibration.sizes['spectrum'], 5]),
         coords={
             'spectrum': calibration.coords['spectrum'],
-            'tof': sc.linspace('tof', 1.0, 1000.0, 27, unit='us'),
+            'tof': sc.linspace('tof', 1.0, 1000.0, 5, unit='us'),
         },
     )
+
+
+def test_dspacing_with_calibration_roundtrip(calibration, base_tof):
+    initial_tof = base_tof
     dspacing = to_dspacing_with_calibration(initial_tof, calibration=calibration)
 
     d = dspacing.coords['dspacing']
     difa = calibration['difa'].data
     difc = calibration['difc'].data
     tzero = calibration['tzero'].data
-    recomputed_tof = difa * d**2 + difc * d + tzero
+    recomputed_tof = (difa * d + difc) * d + tzero
     recomputed_tof = recomputed_tof.rename_dims({'dspacing': 'tof'})
     assert sc.allclose(recomputed_tof, initial_tof.coords['tof'])
 
@@ -62,12 +67,12 @@ def test_dspacing_with_calibration_roundtrip(calibration):
 def test_dspacing_with_calibration_roundtrip_with_wavelength(calibration):
     initial_wavelength = sc.DataArray(
         sc.ones(
-            dims=['spectrum', 'wavelength'], shape=[calibration.sizes['spectrum'], 27]
+            dims=['spectrum', 'wavelength'], shape=[calibration.sizes['spectrum'], 5]
         ),
         coords={
             'spectrum': calibration.coords['spectrum'],
-            'wavelength': sc.linspace('wavelength', 10.0, 100.0, 27, unit='angstrom'),
-            'tof': sc.linspace('wavelength', 1.0, 1000.0, 27, unit='us'),
+            'wavelength': sc.linspace('wavelength', 10.0, 100.0, 5, unit='angstrom'),
+            'tof': sc.linspace('wavelength', 1.0, 1000.0, 5, unit='us'),
         },
     )
     dspacing = to_dspacing_with_calibration(initial_wavelength, calibration=calibration)
@@ -76,7 +81,7 @@ def test_dspacing_with_calibration_roundtrip_with_wavelength(calibration):
     difa = calibration['difa'].data
     difc = calibration['difc'].data
     tzero = calibration['tzero'].data
-    recomputed_tof = difa * d**2 + difc * d + tzero
+    recomputed_tof = (difa * d + difc) * d + tzero
     recomputed_tof = recomputed_tof.rename_dims({'dspacing': 'tof'})
     assert sc.allclose(
         recomputed_tof,
@@ -84,23 +89,17 @@ def test_dspacing_with_calibration_roundtrip_with_wavelength(calibration):
     )
 
 
-def test_dspacing_with_calibration_consumes_positions(calibration):
+# Position handling does not depend on the calibration values.
+@pytest.mark.parametrize('calibration', ['random'], indirect=True)
+def test_dspacing_with_calibration_consumes_positions(calibration, base_tof):
     rng = np.random.default_rng(9274)
     n_spectra = calibration.sizes['spectrum']
-    tof = sc.DataArray(
-        sc.ones(dims=['spectrum', 'tof'], shape=[calibration.sizes['spectrum'], 27]),
-        coords={
-            'spectrum': calibration.coords['spectrum'],
-            'tof': sc.linspace('tof', 1.0, 1000.0, 27, unit='us'),
-            'position': sc.vectors(
-                dims=['spectrum'],
-                values=rng.uniform(-2.0, 2.0, (n_spectra, 3)),
-                unit='m',
-            ),
-            'sample_position': sc.vector(value=[0.1, 0.02, 0.0], unit='m'),
-            'source_position': sc.vector(value=[-10.0, -1.0, 0.0], unit='m'),
-        },
+    tof = base_tof.copy(deep=False)
+    tof.coords['position'] = sc.vectors(
+        dims=['spectrum'], values=rng.uniform(-2.0, 2.0, (n_spectra, 3)), unit='m'
     )
+    tof.coords['sample_position'] = sc.vector(value=[0.1, 0.02, 0.0], unit='m')
+    tof.coords['source_position'] = sc.vector(value=[-10.0, -1.0, 0.0], unit='m')
     dspacing = to_dspacing_with_calibration(tof, calibration=calibration)
     assert sc.identical(dspacing.coords['position'], tof.coords['position'])
     assert not dspacing.coords['position'].aligned
@@ -114,17 +113,12 @@ def test_dspacing_with_calibration_consumes_positions(calibration):
     assert not dspacing.coords['source_position'].aligned
 
 
-def test_dspacing_with_calibration_does_not_use_positions(calibration):
+@pytest.mark.parametrize('calibration', ['random'], indirect=True)
+def test_dspacing_with_calibration_does_not_use_positions(calibration, base_tof):
     rng = np.random.default_rng(91032)
     n_spectra = calibration.sizes['spectrum']
-    tof_no_pos = sc.DataArray(
-        sc.ones(dims=['spectrum', 'tof'], shape=[n_spectra, 27]),
-        coords={
-            'spectrum': calibration.coords['spectrum'],
-            'tof': sc.linspace('tof', 1.0, 1000.0, 27, unit='us'),
-        },
-    )
-    tof_pos = tof_no_pos.copy()
+    tof_no_pos = base_tof
+    tof_pos = tof_no_pos.copy(deep=False)
     tof_pos.coords['position'] = sc.vectors(
         dims=['spectrum'], values=rng.uniform(-2.0, 2.0, (n_spectra, 3)), unit='m'
     )
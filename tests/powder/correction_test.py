@@ -21,25 +21,20 @@ from ess.powder.types import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def calibration():
     rng = np.random.default_rng(789236)
     n = 30
+    # Draw all parameters in one call and scale to the ranges
+    # difa in [1e2, 1e3), difc in [1e3, 1e4), tzero in [-1e2, 1e2).
+    low = np.array([[1.0e2], [1.0e3], [-1.0e2]])
+    high = np.array([[1.0e3], [1.0e4], [1.0e2]])
+    difa, difc, tzero = low + (high - low) * rng.random((3, n))
     ds = sc.Dataset(
         data={
-            'difa': sc.array(
-                dims=['spectrum'],
-                values=rng.uniform(1.0e2, 1.0e3, n),
-                unit='us / angstrom**2',
-            ),
-            'difc': sc.array(
-                dims=['spectrum'],
-                values=rng.uniform(1.0e3, 1.0e4, n),
-                unit='us / angstrom',
-            ),
-            'tzero': sc.array(
-                dims=['spectrum'], values=rng.uniform(-1e2, 1e2, n), unit='us'
-            ),
+            'difa': sc.array(dims=['spectrum'], values=difa, unit='us / angstrom**2'),
+            'difc': sc.array(dims=['spectrum'], values=difc, unit='us / angstrom'),
+            'tzero': sc.array(dims=['spectrum'], values=tzero, unit='us'),
             'mask': sc.full(dims=['spectrum'], shape=[n], value=False, unit=None),
         },
         coords={'spectrum': sc.arange('spectrum', n, unit=None)},
@@ -56,10 +51,10 @@ def test_merge_calibration_add_all_parameters(calibration):
     )
     with_cal = merge_calibration(into=da, calibration=calibration)
 
-    assert sc.identical(with_cal.coords['difa'], calibration['difa'].data)
-    assert sc.identical(with_cal.coords['difc'], calibration['difc'].data)
-    assert sc.identical(with_cal.coords['tzero'], calibration['tzero'].data)
-    assert sc.identical(with_cal.masks['calibration'], calibration['mask'].data)
+    sc.testing.assert_identical(with_cal.coords['difa'], calibration['difa'].data)
+    sc.testing.assert_identical(with_cal.coords['difc'], calibration['difc'].data)
+    sc.testing.assert_identical(with_cal.coords['tzero'], calibration['tzero'].data)
+    sc.testing.assert_identical(with_cal.masks['calibration'], calibration['mask'].data)
 
 
 def test_merge_calibration_raises_if_spectrum_mismatch(calibration):
@@ -75,40 +70,13 @@ def test_merge_calibration_raises_if_spectrum_mismatch(calibration):
         merge_calibration(into=da, calibration=calibration)
 
 
-def test_merge_calibration_raises_if_difa_exists(calibration):
-    da = sc.DataArray(
-        sc.ones(sizes=calibration.sizes),
-        coords={
-            'spectrum': sc.arange('spectrum', calibration.sizes['spectrum'], unit=None),
-            'difa': sc.ones(sizes={'spectrum': calibration.sizes['spectrum']}),
-        },
-    )
-    with pytest.raises(
-        ValueError, match='there already is metadata with the same name'
-    ):
-        merge_calibration(into=da, calibration=calibration)
-
-
-def test_merge_calibration_raises_if_difc_exists(calibration):
+@pytest.mark.parametrize('name', ['difa', 'difc', 'tzero'])
+def test_merge_calibration_raises_if_parameter_exists(calibration, name):
     da = sc.DataArray(
         sc.ones(sizes=calibration.sizes),
         coords={
             'spectrum': sc.arange('spectrum', calibration.sizes['spectrum'], unit=None),
-            'difc': sc.ones(sizes={'spectrum': calibration.sizes['spectrum']}),
-        },
-    )
-    with pytest.raises(
-        ValueError, match='there already is metadata with the same name'
-    ):
-        merge_calibration(into=da, calibration=calibration)
-
-
-def test_merge_calibration_raises_if_tzero_exists(calibration):
-    da = sc.DataArray(
-        sc.ones(sizes=calibration.sizes),
-        coords={
-            'spectrum': sc.arange('spectrum', calibration.sizes['spectrum'], unit=None),
-            'tzero': sc.ones(sizes={'spectrum': calibration.sizes['spectrum']}),
+            name: sc.ones(sizes={'spectrum': calibration.sizes['spectrum']}),
         },
     )
     with pytest.raises(
@@ -131,9 +99,19 @@ def test_merge_calibration_raises_if_mask_exists(calibration):
         merge_calibration(into=da, calibration=calibration)
 
 
-@pytest.mark.parametrize('data_dtype', ['float32', 'float64'])
-@pytest.mark.parametrize('dspacing_dtype', ['float32', 'float64'])
-@pytest.mark.parametrize('two_theta_dtype', ['float32', 'float64'])
+# Covers same-precision inputs and both directions of mixed precision
+# between the data and the coords.
+LORENTZ_DTYPE_COMBINATIONS = [
+    ('float64', 'float64', 'float64'),
+    ('float32', 'float32', 'float32'),
+    ('float32', 'float64', 'float64'),
+    ('float64', 'float32', 'float32'),
+]
+
+
+@pytest.mark.parametrize(
+    ('data_dtype', 'dspacing_dtype', 'two_theta_dtype'), LORENTZ_DTYPE_COMBINATIONS
+)
 def test_lorentz_correction_dense_1d_coords(
     data_dtype, dspacing_dtype, two_theta_dtype
 ):
@@ -223,9 +201,9 @@ def test_apply_lorentz_correction_dense_2d_coord():
         sc.testing.assert_identical(da.coords[key], original.coords[key])
 
 
-@pytest.mark.parametrize('data_dtype', ['float32', 'float64'])
-@pytest.mark.parametrize('dspacing_dtype', ['float32', 'float64'])
-@pytest.mark.parametrize('two_theta_dtype', ['float32', 'float64'])
+@pytest.mark.parametrize(
+    ('data_dtype', 'dspacing_dtype', 'two_theta_dtype'), LORENTZ_DTYPE_COMBINATIONS
+)
 def test_apply_lorentz_correction_event_coords(
     data_dtype, dspacing_dtype, two_theta_dtype
 ):
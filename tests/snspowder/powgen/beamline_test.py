@@ -0,0 +1,60 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
+import pytest
+import scipp as sc
+
+from ess.snspowder.powgen.beamline import map_detector_to_spectrum
+
+
+def make_detector_info(detector_ids: list[int]) -> sc.Dataset:
+    n = len(detector_ids)
+    return sc.Dataset(
+        coords={
+            'detector': sc.array(dims=['detector'], values=detector_ids, unit=None),
+            'spectrum': sc.arange('detector', n, unit=None),
+        }
+    )
+
+
+def make_data(detector: sc.Variable) -> sc.DataArray:
+    return sc.DataArray(
+        sc.ones(sizes=detector.sizes, unit='counts'), coords={'detector': detector}
+    )
+
+
+def test_map_detector_to_spectrum():
+    detector_info = make_detector_info([1, 2, 3, 4, 5])
+    data = make_data(detector_info.coords['detector'].copy())
+
+    result = map_detector_to_spectrum(data, detector_info=detector_info)
+
+    assert result.dims == ('spectrum',)
+    assert 'detector' not in result.coords
+    assert sc.identical(
+        result.coords['spectrum'], sc.arange('spectrum', 1, 6, unit=None)
+    )
+
+
+def test_map_detector_to_spectrum_accepts_different_dtype():
+    detector_info = make_detector_info([1, 2, 3, 4, 5])
+    data = make_data(detector_info.coords['detector'].to(dtype='int32'))
+
+    result = map_detector_to_spectrum(data, detector_info=detector_info)
+
+    assert result.sizes == {'spectrum': 5}
+
+
+@pytest.mark.parametrize(
+    'detector',
+    [
+        sc.array(dims=['detector'], values=[1, 3, 3, 2, 5], unit=None),
+        sc.array(dims=['detector'], values=[1, 2, 3, 4, 5], unit='m'),
+        sc.array(dims=['detector'], values=[1, 2, 3, 4], unit=None),
+    ],
+)
+def test_map_detector_to_spectrum_raises_if_detector_mismatch(detector):
+    detector_info = make_detector_info([1, 2, 3, 4, 5])
+    data = make_data(detector)
+
+    with pytest.raises(sc.CoordError):
+        map_detector_to_spectrum(data, detector_info=detector_info)
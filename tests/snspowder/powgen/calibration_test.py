@@ -0,0 +1,30 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
+import numpy as np
+import pytest
+import scipp as sc
+
+from ess.snspowder.powgen.calibration import _as_boolean_mask
+
+
+@pytest.mark.parametrize('dtype', ['float32', 'float64', 'int64', 'bool'])
+def test_as_boolean_mask(dtype):
+    var = sc.array(dims=['x'], values=[0, 1, 0, 1], dtype=dtype, unit=None)
+    result = _as_boolean_mask(var)
+    assert sc.identical(
+        result, sc.array(dims=['x'], values=[False, True, False, True], unit=None)
+    )
+
+
+def test_as_boolean_mask_returns_new_variable():
+    var = sc.array(dims=['x'], values=[False, True], unit=None)
+    result = _as_boolean_mask(var)
+    result.values[0] = True
+    assert not var.values[0]
+
+
+@pytest.mark.parametrize('bad_value', [0.5, np.inf, -np.inf, np.nan])
+def test_as_boolean_mask_raises_for_non_integer_values(bad_value):
+    var = sc.array(dims=['x'], values=[0.0, 1.0, bad_value], unit=None)
+    with pytest.raises(ValueError, match='Cannot construct boolean mask'):
+        _as_boolean_mask(var)
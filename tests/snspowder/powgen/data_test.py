@@ -0,0 +1,35 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
+import pytest
+import scipp as sc
+import scipp.testing
+
+from ess.powder.types import DetectorBankSizes
+from ess.snspowder.powgen.data import pooch_load_calibration
+
+
+# scipp's HDF5 writer still accesses the deprecated attrs.
+@pytest.mark.filterwarnings('ignore::scipp.VisibleDeprecationWarning')
+def test_pooch_load_calibration_folds_items_and_keeps_masks(tmp_path):
+    sizes = DetectorBankSizes({'bank': 2, 'column': 3})
+    n = 6
+    spectrum = sc.arange('spectrum', n, unit=None)
+    difc = sc.DataArray(
+        sc.linspace('spectrum', 1.0e3, 2.0e3, n, unit='us / angstrom'),
+        coords={'spectrum': spectrum},
+        masks={'bad': sc.array(dims=['spectrum'], values=[False, True] * 3)},
+    )
+    tzero = sc.DataArray(
+        sc.linspace('spectrum', -1.0, 1.0, n, unit='us'),
+        coords={'spectrum': spectrum},
+    )
+    filename = tmp_path / 'calibration.h5'
+    sc.Dataset({'difc': difc, 'tzero': tzero}).save_hdf5(filename)
+
+    loaded = pooch_load_calibration(filename, sizes)
+
+    assert loaded.sizes == sizes
+    sc.testing.assert_identical(loaded['difc'], difc.fold(dim='spectrum', sizes=sizes))
+    sc.testing.assert_identical(
+        loaded['tzero'], tzero.fold(dim='spectrum', sizes=sizes)
+    )
@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
 
+import numpy as np
 import pytest
 import sciline
 import scipp as sc
@@ -27,14 +28,14 @@ from ess.powder.types import (
 from ess.snspowder import powgen
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def providers():
     from ess import powder
 
     return [*powder.providers, *powgen.providers, *powgen.data.providers]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def params():
     return {
         NeXusDetectorName: "powgen_detector",
@@ -50,13 +51,17 @@ def params():
     }
 
 
+@pytest.fixture(scope="module")
+def pipeline(providers, params):
+    pipeline = sciline.Pipeline(providers, params=params)
+    return powder.with_pixel_mask_filenames(pipeline, [])
+
+
 def test_can_create_pipeline(providers, params):
     sciline.Pipeline(providers, params=params)
 
 
-def test_pipeline_can_compute_dspacing_result(providers, params):
-    pipeline = sciline.Pipeline(providers, params=params)
-    pipeline = powder.with_pixel_mask_filenames(pipeline, [])
+def test_pipeline_can_compute_dspacing_result(pipeline, params):
     result = pipeline.compute(IofDspacing)
     assert result.sizes == {
         'dspacing': len(params[DspacingBins]) - 1,
@@ -64,10 +69,9 @@ def test_pipeline_can_compute_dspacing_result(providers, params):
     assert sc.identical(result.coords['dspacing'], params[DspacingBins])
 
 
-def test_pipeline_can_compute_dspacing_result_without_calibration(providers, params):
-    params[CalibrationFilename] = None
-    pipeline = sciline.Pipeline(providers, params=params)
-    pipeline = powder.with_pixel_mask_filenames(pipeline, [])
+def test_pipeline_can_compute_dspacing_result_without_calibration(pipeline, params):
+    pipeline = pipeline.copy()
+    pipeline[CalibrationFilename] = None
     result = pipeline.compute(IofDspacing)
     assert result.sizes == {
         'dspacing': len(params[DspacingBins]) - 1,
@@ -75,14 +79,11 @@ def test_pipeline_can_compute_dspacing_result_without_calibration(providers, par
     assert sc.identical(result.coords['dspacing'], params[DspacingBins])
 
 
-def test_pipeline_compare_with_and_without_calibration(providers, params):
-    pipeline = sciline.Pipeline(providers, params=params)
-    pipeline = powder.with_pixel_mask_filenames(pipeline, [])
+def test_pipeline_compare_with_and_without_calibration(pipeline):
     result_w_cal = pipeline.compute(IofDspacing)
 
-    params[CalibrationFilename] = None
-    pipeline = sciline.Pipeline(providers, params=params)
-    pipeline = powder.with_pixel_mask_filenames(pipeline, [])
+    pipeline = pipeline.copy()
+    pipeline[CalibrationFilename] = None
     result_wo_cal = pipeline.compute(IofDspacing)
 
     assert sc.identical(
@@ -91,49 +92,44 @@ def test_pipeline_compare_with_and_without_calibration(providers, params):
     assert not sc.allclose(result_w_cal.hist().data, result_wo_cal.hist().data)
 
 
-def test_workflow_is_deterministic(providers, params):
-    pipeline = sciline.Pipeline(providers, params=params)
-    pipeline = powder.with_pixel_mask_filenames(pipeline, [])
+def test_workflow_is_deterministic(pipeline):
     # This is Sciline's default scheduler, but we want to be explicit here
     scheduler = sciline.scheduler.DaskScheduler()
     graph = pipeline.get(IofDspacing, scheduler=scheduler)
     reference = graph.compute().hist().data
     result = graph.compute().hist().data
-    assert sc.identical(sc.values(result), sc.values(reference))
+    assert np.array_equal(result.values, reference.values)
 
 
-def test_pipeline_can_compute_intermediate_results(providers, params):
-    pipeline = sciline.Pipeline(providers, params=params)
-    pipeline = powder.with_pixel_mask_filenames(pipeline, [])
+def test_pipeline_can_compute_intermediate_results(pipeline):
     result = pipeline.compute(NormalizedRunData[SampleRun])
     assert set(result.dims) == {'bank', 'column', 'row'}
 
 
-def test_pipeline_group_by_two_theta(providers, params):
-    params[TwoThetaBins] = sc.linspace(
+def test_pipeline_group_by_two_theta(pipeline, params):
+    two_theta_bins = sc.linspace(
         dim='two_theta', unit='deg', start=25.0, stop=90.0, num=16
     ).to(unit='rad')
-    pipeline = sciline.Pipeline(providers, params=params)
-    pipeline = powder.with_pixel_mask_filenames(pipeline, [])
+    pipeline = pipeline.copy()
+    pipeline[TwoThetaBins] = two_theta_bins
     result = pipeline.compute(IofDspacingTwoTheta)
     assert result.sizes == {
         'two_theta': 15,
         'dspacing': len(params[DspacingBins]) - 1,
     }
     assert sc.identical(result.coords['dspacing'], params[DspacingBins])
-    assert sc.allclose(result.coords['two_theta'], params[TwoThetaBins])
+    assert sc.allclose(result.coords['two_theta'], two_theta_bins)
 
 
-def test_pipeline_wavelength_masking(providers, params):
+def test_pipeline_wavelength_masking(pipeline):
     wmin = sc.scalar(0.18, unit="angstrom")
     wmax = sc.scalar(0.21, unit="angstrom")
-    params[WavelengthMask] = lambda x: (x > wmin) & (x < wmax)
-    pipeline = sciline.Pipeline(providers, params=params)
-    pipeline = powder.with_pixel_mask_filenames(pipeline, [])
+    pipeline = pipeline.copy()
+    pipeline[WavelengthMask] = lambda x: (x > wmin) & (x < wmax)
     masked_sample = pipeline.compute(MaskedData[SampleRun])
     assert 'wavelength' in masked_sample.bins.masks
     sum_in_masked_region = (
-        masked_sample.bin(wavelength=sc.concat([wmin, wmax], dim='wavelength'))
+        masked_sample.hist(wavelength=sc.concat([wmin, wmax], dim='wavelength'))
         .sum()
         .data
     )
@@ -143,12 +139,11 @@ def test_pipeline_wavelength_masking(providers, params):
     )
 
 
-def test_pipeline_two_theta_masking(providers, params):
+def test_pipeline_two_theta_masking(pipeline):
     tmin = sc.scalar(0.8, unit="rad")
     tmax = sc.scalar(1.0, unit="rad")
-    params[TwoThetaMask] = lambda x: (x > tmin) & (x < tmax)
-    pipeline = sciline.Pipeline(providers, params=params)
-    pipeline = powder.with_pixel_mask_filenames(pipeline, [])
+    pipeline = pipeline.copy()
+    pipeline[TwoThetaMask] = lambda x: (x > tmin) & (x < tmax)
     masked_sample = pipeline.compute(MaskedData[SampleRun])
     assert 'two_theta' in masked_sample.masks
     sum_in_masked_region = (